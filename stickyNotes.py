@@ -1,35 +1,236 @@
 import sys
 import json
 import os
+import bisect
+import glob
+import hashlib
 import uuid
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QLabel, QScrollArea, QTextEdit, QFrame,
-    QMessageBox, QSizePolicy
+    QLineEdit, QPushButton, QLabel, QListView, QTextEdit, QPlainTextEdit, QFrame,
+    QMessageBox, QSizePolicy, QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
-from PyQt6.QtGui import QMouseEvent, QTextDocument, QColor, QPalette, QBrush, QTextCharFormat, QTextCursor, QFont
+from PyQt6.QtCore import (
+    Qt, QSize, QRect, QRectF, QTimer, QElapsedTimer, QEvent, pyqtSignal, QSignalBlocker, QRunnable, QThreadPool,
+    QMutex, QMutexLocker,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel
+)
+from PyQt6.QtGui import QMouseEvent, QColor, QBrush, QTextCharFormat, QTextCursor, QTextDocument, QFont, QPainter
+
+# Use orjson for (de)serializing notes when it's installed, it is several times faster
+# than the standard library json module. Both paths work on UTF-8 bytes and write compact
+# JSON: indenting only pads the small metadata files with whitespace, and it keeps the
+# json module from using its C encoder.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
 
 
 # --- Configuration ---
-NOTES_FILE = "sticky_notes_data.json"
+NOTES_DIR = "sticky_notes_data" # One <id>.json (metadata) and one <id>.txt or <id>.html (plain/rich text content) file per note
+NOTES_FILE = "sticky_notes_data.json" # Legacy single-file store, migrated to NOTES_DIR on the next save
 TOOLBAR_WIDTH = 300  # Fixed width for the toolbar
 PREVIEW_LINES = 5    # Number of lines to show in the note preview
+TEXT_CHANGE_DELAY_MS = 300 # Idle time after the last keystroke before a note is re-serialized
+SAVE_DELAY_MS = 500 # Idle time after the last note update before notes are written to disk
+FILTER_DELAY_MS = 200 # Idle time after the last keystroke in the toolbar filter before it is applied
 
 # --- Resizing configuration for frameless windows ---
 RESIZE_GRIP_SIZE = 8 # Pixels from the edge where resizing is active
+DRAG_UPDATE_INTERVAL_MS = 1000 // 120 # Cap window moves/resizes while dragging to ~120 per second
+
+# Window edges under the mouse, as a bit mask (see StickyNoteWindow._edge_mask)
+EDGE_TOP, EDGE_BOTTOM, EDGE_LEFT, EDGE_RIGHT = 0b1000, 0b0100, 0b0010, 0b0001
+
+# Cursor shown when hovering each resizable edge/corner
+_EDGE_CURSORS = {
+    EDGE_TOP | EDGE_LEFT: Qt.CursorShape.SizeFDiagCursor,
+    EDGE_BOTTOM | EDGE_RIGHT: Qt.CursorShape.SizeFDiagCursor,
+    EDGE_TOP | EDGE_RIGHT: Qt.CursorShape.SizeBDiagCursor,
+    EDGE_BOTTOM | EDGE_LEFT: Qt.CursorShape.SizeBDiagCursor,
+    EDGE_LEFT: Qt.CursorShape.SizeHorCursor,
+    EDGE_RIGHT: Qt.CursorShape.SizeHorCursor,
+    EDGE_TOP: Qt.CursorShape.SizeVerCursor,
+    EDGE_BOTTOM: Qt.CursorShape.SizeVerCursor,
+}
+
+# How dragging each edge/corner changes the window size: (width_sign, height_sign).
+# A negative sign means the left/top edge moves, so x/y shift by the change in size.
+_EDGE_RESIZE_SIGNS = {
+    EDGE_TOP | EDGE_LEFT: (-1, -1),
+    EDGE_TOP | EDGE_RIGHT: (1, -1),
+    EDGE_BOTTOM | EDGE_LEFT: (-1, 1),
+    EDGE_BOTTOM | EDGE_RIGHT: (1, 1),
+    EDGE_LEFT: (-1, 0),
+    EDGE_RIGHT: (1, 0),
+    EDGE_TOP: (0, -1),
+    EDGE_BOTTOM: (0, 1),
+}
+
+# --- Styling ---
+# One style sheet for the whole application, installed on the QApplication in main().
+# Widgets are matched by object name; within a window, later rules override earlier ones
+# of the same specificity, so frames come before the widgets placed on them.
+APP_STYLE_SHEET = """
+/* Sticky note windows */
+#NoteContainer, #NoteContainer QWidget { background-color: #FFFF99; border-radius: 5px; border: 1px solid #AAAAAA; }
+QWidget#NoteTitleBar, #NoteTitleBar QWidget { background-color: #CCCCFF; border-top-left-radius: 5px; border-top-right-radius: 5px; }
+QFrame#NoteContent, #NoteContent QWidget { background-color: #FFFF99; border-bottom-left-radius: 5px; border-bottom-right-radius: 5px; }
+QPushButton#RichTextButton { background-color: #ccccff; border: 1px solid #9999ff; border-radius: 3px; }
+QPushButton#DeleteNoteButton { background-color: #ffcccc; border: 1px solid #ff9999; border-radius: 3px; }
+
+/* Toolbar window */
+QMainWindow#Toolbar { background-color: #E0E0E0; }
+#ToolbarCentral, #ToolbarCentral QWidget { background-color: #E0E0E0; border-radius: 5px; border: 1px solid #AAAAAA; }
+#ToolbarCentral QLineEdit { padding: 5px; border: 1px solid #ccc; border-radius: 3px; }
+#ToolbarCentral QPushButton { padding: 5px; }
+QFrame#ToolbarTitleBar, #ToolbarTitleBar QWidget { background-color: #A0A0A0; border-top-left-radius: 5px; border-top-right-radius: 5px; }
+
+/* Title bars (notes and toolbar) */
+QLabel#TitleLabel { color: black; font-weight: bold; font-size: 11pt; }
+QPushButton#MinimizeButton { background-color: #7777CC; border: 1px solid #5555AA; border-radius: 5px; color: white; font-weight: bold; font-size: 12pt; }
+QPushButton#MinimizeButton:hover { background-color: #5555AA; }
+QPushButton#CloseButton { background-color: #CC3333; border: 1px solid #990000; border-radius: 5px; color: white; font-weight: bold; font-size: 12pt; }
+QPushButton#CloseButton:hover { background-color: #990000; }
+"""
 
 # --- Note Data Structure ---
 # Each note will be stored as a dictionary:
 # {
 #   "id": "uuid",
 #   "title": "First line of note for preview/identification",
-#   "content": "HTML content from QTextEdit",
+#   "content": "HTML or plain text content", # Only present once the note has been opened
+#   "rich": bool, # True if content is HTML edited in a QTextEdit, False for plain text in a QPlainTextEdit
 #   "x": int, # Last known X position of the sticky note window
 #   "y": int, # Last known Y position of the sticky note window
 #   "width": int, # Last known width of the sticky note window
 #   "height": int # Last known height of the sticky note window
 # }
+# Notes saved before "rich" existed are HTML, so a missing "rich" means True.
+# On disk everything but "content" goes to NOTES_DIR/<id>.json,
+# "content" goes to NOTES_DIR/<id>.html (rich) or NOTES_DIR/<id>.txt (plain).
+
+
+def _note_meta_path(note_id):
+    return os.path.join(NOTES_DIR, f"{note_id}.json")
+
+
+def _note_content_path(note_id, rich):
+    return os.path.join(NOTES_DIR, f"{note_id}.html" if rich else f"{note_id}.txt")
+
+
+def _intern_short_strings(note):
+    """
+    Returns a loaded note with its keys and short string values interned, so the copies
+    repeated across notes (field names, default titles) share one string object.
+    """
+    return {
+        sys.intern(key): sys.intern(value) if isinstance(value, str) and len(value) < 64 else value
+        for key, value in note.items()
+    }
+
+
+def _payload_digest(payload):
+    """Short fingerprint of a file's bytes, so unchanged files are detected without keeping their contents around."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _write_file_atomic(path, payload):
+    """Writes bytes to a temporary file first so a crash mid-write can't corrupt path."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class _SaveRunnable(QRunnable):
+    """
+    Serializes a snapshot of the notes and writes it to disk on a worker thread,
+    so saving never blocks the GUI. Files are left untouched if nothing changed.
+    Whatever couldn't be written or removed is reported through save_failed.
+    """
+    def __init__(self, snapshot, deleted_note_ids, remove_legacy_file, saved_digests, saved_digests_lock, save_failed):
+        super().__init__()
+        self.snapshot = snapshot # [(note_id, metadata, content)], content is None if the note was never opened
+        self.deleted_note_ids = deleted_note_ids # Notes whose files should be removed
+        self.remove_legacy_file = remove_legacy_file # Remove NOTES_FILE once the snapshot is written, migrating its notes
+        self.saved_digests = saved_digests # {file path: digest of the bytes on disk}, shared with the GUI thread
+        self.saved_digests_lock = saved_digests_lock # QMutex guarding saved_digests
+        self.save_failed = save_failed # Signal: note ids to save again, note ids to remove again, legacy file still there
+
+    def run(self):
+        try:
+            os.makedirs(NOTES_DIR, exist_ok=True)
+        except Exception as e:
+            print(f"Error saving notes: {e}")
+            self.save_failed.emit([note_id for note_id, _, _ in self.snapshot], list(self.deleted_note_ids), self.remove_legacy_file)
+            return
+
+        failed_note_ids = []
+        for note_id, metadata, content in self.snapshot:
+            try:
+                self._save_note(note_id, metadata, content)
+            except Exception as e:
+                print(f"Error saving note {note_id}: {e}")
+                failed_note_ids.append(note_id)
+
+        failed_deleted_note_ids = []
+        for note_id in self.deleted_note_ids:
+            try:
+                for path in (_note_meta_path(note_id), _note_content_path(note_id, True), _note_content_path(note_id, False)):
+                    self._remove_file(path)
+            except Exception as e:
+                print(f"Error removing note {note_id}: {e}")
+                failed_deleted_note_ids.append(note_id)
+
+        legacy_file_pending = self.remove_legacy_file
+        if legacy_file_pending and not failed_note_ids: # Only once every legacy note is in NOTES_DIR
+            try:
+                self._remove_file(NOTES_FILE)
+                legacy_file_pending = False
+            except Exception as e:
+                print(f"Error removing {NOTES_FILE}: {e}")
+
+        if failed_note_ids or failed_deleted_note_ids or legacy_file_pending:
+            self.save_failed.emit(failed_note_ids, failed_deleted_note_ids, legacy_file_pending)
+
+    def _save_note(self, note_id, metadata, content):
+        # Content goes first: metadata saying "rich" must never point at a content file that isn't there yet
+        rich = metadata.get("rich", True)
+        if content is not None: # Content of notes that were never opened is already on disk
+            self._write_file_if_changed(_note_content_path(note_id, rich), content.encode('utf-8'))
+        self._write_file_if_changed(_note_meta_path(note_id), _dumps(metadata))
+        if content is not None and rich:
+            plain_text_path = _note_content_path(note_id, False)
+            with QMutexLocker(self.saved_digests_lock):
+                switched_to_rich_text = plain_text_path in self.saved_digests
+            if switched_to_rich_text:
+                self._remove_file(plain_text_path) # Both files of the rich text note are written
+
+    def _write_file_if_changed(self, path, payload):
+        """Writes payload to path unless it is what was last written there."""
+        digest = _payload_digest(payload)
+        with QMutexLocker(self.saved_digests_lock):
+            if self.saved_digests.get(path) == digest:
+                return
+        _write_file_atomic(path, payload)
+        with QMutexLocker(self.saved_digests_lock): # Only once it is actually on disk
+            self.saved_digests[path] = digest
+
+    def _remove_file(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+        with QMutexLocker(self.saved_digests_lock):
+            self.saved_digests.pop(path, None)
 
 
 class DraggableTitleBar(QWidget):
@@ -41,9 +242,10 @@ class DraggableTitleBar(QWidget):
         super().__init__(parent)
         self.parent_window = parent # Reference to the QMainWindow (StickyNoteWindow)
         self.old_pos = None
+        self.start_window_pos = None
 
         self.setFixedHeight(35) # Slightly increased height for the title bar
-        self.setStyleSheet("background-color: #CCCCFF; border-top-left-radius: 5px; border-top-right-radius: 5px;")
+        self.setObjectName("NoteTitleBar")
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True) # Ensure stylesheet is applied
 
         self.layout = QHBoxLayout(self)
@@ -52,44 +254,40 @@ class DraggableTitleBar(QWidget):
 
         # Note Title Label
         self.title_label = QLabel(note_title)
-        self.title_label.setStyleSheet("color: black; font-weight: bold; font-size: 11pt;") # Slightly larger font
+        self.title_label.setObjectName("TitleLabel")
         self.layout.addWidget(self.title_label)
         self.layout.addStretch() # Pushes buttons to the right
 
         # Minimize Button
         self.minimize_button = QPushButton("—") # Unicode minus sign for minimize
         self.minimize_button.setFixedSize(30, 30) # Increased button size
-        self.minimize_button.setStyleSheet(
-            "QPushButton { background-color: #7777CC; border: 1px solid #5555AA; border-radius: 5px; color: white; font-weight: bold; font-size: 12pt; }"
-            "QPushButton:hover { background-color: #5555AA; }"
-        )
+        self.minimize_button.setObjectName("MinimizeButton")
         self.minimize_button.clicked.connect(self.parent_window.showMinimized)
         self.layout.addWidget(self.minimize_button)
 
         # Close Button
         self.close_button = QPushButton("X")
         self.close_button.setFixedSize(30, 30) # Increased button size
-        self.close_button.setStyleSheet(
-            "QPushButton { background-color: #CC3333; border: 1px solid #990000; border-radius: 5px; color: white; font-weight: bold; font-size: 12pt; }"
-            "QPushButton:hover { background-color: #990000; }"
-        )
+        self.close_button.setObjectName("CloseButton")
         self.close_button.clicked.connect(self.parent_window.close)
         self.layout.addWidget(self.close_button)
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
             self.old_pos = event.globalPosition().toPoint()
+            self.start_window_pos = self.parent_window.pos()
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent):
         if event.buttons() == Qt.MouseButton.LeftButton and self.old_pos is not None:
             delta = event.globalPosition().toPoint() - self.old_pos
-            self.parent_window.move(self.parent_window.x() + delta.x(), self.parent_window.y() + delta.y())
-            self.old_pos = event.globalPosition().toPoint()
+            self.parent_window.set_geometry_throttled(QRect(self.start_window_pos + delta, self.parent_window.size()))
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
+        self.parent_window.flush_pending_geometry()
         self.old_pos = None
+        self.start_window_pos = None
         super().mouseReleaseEvent(event)
 
     def set_note_title(self, title):
@@ -102,6 +300,7 @@ class StickyNoteWindow(QMainWindow):
     """
     note_updated = pyqtSignal(str, dict) # Signal: note_id, note_data
     note_deleted = pyqtSignal(str)       # Signal: note_id
+    note_closed = pyqtSignal(str)        # Signal: note_id
 
     def __init__(self, note_id, note_data, parent=None):
         super().__init__(parent)
@@ -118,6 +317,7 @@ class StickyNoteWindow(QMainWindow):
             Qt.WindowType.WindowStaysOnTopHint
         )
         self.setMinimumSize(200, 150) # Set a minimum size for the sticky note window
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose) # Free the window on close, reopening rebuilds it from note_data
 
         self.setGeometry(
             self.note_data.get("x", 100),
@@ -128,10 +328,19 @@ class StickyNoteWindow(QMainWindow):
 
         # Resizing state variables
         self.resizing = False
-        self.resizing_from = None
+        self.resizing_from = 0 # Edge mask of the border being dragged
         self.start_pos = None
         self.start_geometry = None
 
+        # Geometry changes while dragging are rate limited; the latest skipped one is applied later
+        self._resize_clock = QElapsedTimer()
+        self._resize_clock.start()
+        self._pending_geometry = None
+        self._pending_geometry_timer = QTimer(self)
+        self._pending_geometry_timer.setSingleShot(True)
+        self._pending_geometry_timer.setInterval(DRAG_UPDATE_INTERVAL_MS)
+        self._pending_geometry_timer.timeout.connect(self.flush_pending_geometry)
+
         # Create a container widget to hold the custom title bar and content
         self.container_widget = QWidget()
         self.setCentralWidget(self.container_widget)
@@ -147,7 +356,7 @@ class StickyNoteWindow(QMainWindow):
         self.content_widget = QFrame()
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(10, 10, 10, 10) # Padding inside content frame
-        self.content_widget.setStyleSheet("background-color: #FFFF99; border-bottom-left-radius: 5px; border-bottom-right-radius: 5px;")
+        self.content_widget.setObjectName("NoteContent")
         self.content_widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True) # Ensure stylesheet is applied
 
         # Removed Filter input for this specific sticky note as this overwrote what was waved in the note!
@@ -157,35 +366,48 @@ class StickyNoteWindow(QMainWindow):
         # self.content_layout.addWidget(self.note_filter_input)
 
 
-        # Rich text editor
-        self.text_edit = QTextEdit()
-        self.text_edit.setAcceptRichText(True) # Allow HTML, images, tables
-        self.text_edit.setHtml(self.note_data.get("content", "")) # Set original content from note_data
-        self.text_edit.textChanged.connect(self._on_text_changed)
+        # Text editor, set up with the original content from note_data
+        self.text_edit = self._create_text_edit(self.note_data.get("rich", True), self.note_data.get("content", ""))
         self.content_layout.addWidget(self.text_edit)
 
+        # Coalesce bursts of keystrokes into a single serialization pass
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(TEXT_CHANGE_DELAY_MS)
+        self._dirty_timer.timeout.connect(self._flush_text_changes)
+        self._content_dirty = False # Text edited since note_data["content"] was last serialized
+
         # Delete button at the bottom
         self.delete_button_layout = QHBoxLayout()
+
+        # Plain text notes can be switched to rich text (formatting, images, tables) on demand
+        self.rich_text_button = QPushButton("Rich Text")
+        self.rich_text_button.setToolTip("Switch this note to rich text (formatting, images, tables)")
+        self.rich_text_button.clicked.connect(self._enable_rich_text)
+        self.rich_text_button.setObjectName("RichTextButton")
+        self.delete_button_layout.addWidget(self.rich_text_button)
+
         self.delete_button = QPushButton("Delete Note")
         self.delete_button.clicked.connect(self._confirm_delete)
-        self.delete_button.setStyleSheet("background-color: #ffcccc; border: 1px solid #ff9999; border-radius: 3px;") # Reddish delete button
+        self.delete_button.setObjectName("DeleteNoteButton") # Reddish delete button
         self.delete_button_layout.addStretch() # Push button to the right
         self.delete_button_layout.addWidget(self.delete_button)
         self.content_layout.addLayout(self.delete_button_layout)
+        # Only once the button has a parent, or it briefly shows up as a window of its own
+        self.rich_text_button.setVisible(not self.note_data.get("rich", True))
 
         self.main_layout.addWidget(self.content_widget) # Add the content frame to the main layout
 
-        # Apply rounded corners and a subtle border to the entire container widget
-        self.container_widget.setStyleSheet(
-            "QWidget { background-color: #FFFF99; border-radius: 5px; border: 1px solid #AAAAAA; }"
-        )
+        # Rounded corners and a subtle border for the entire container widget (see APP_STYLE_SHEET)
+        self.container_widget.setObjectName("NoteContainer")
         self.container_widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
-        # Enable mouse tracking for cursor changes
+        # Enable mouse tracking for cursor changes. The resize grips are on the frames around
+        # the editor, whose mouse events propagate up to this window; the editor isn't tracked.
         self.setMouseTracking(True)
         self.container_widget.setMouseTracking(True)
         self.content_widget.setMouseTracking(True)
-        self.text_edit.setMouseTracking(True)
+        self._current_cursor_shape = None # Resize cursor currently set on the window, if any
 
 
     def mousePressEvent(self, event: QMouseEvent):
@@ -194,120 +416,184 @@ class StickyNoteWindow(QMainWindow):
             self.start_geometry = self.geometry()
 
             # Check if mouse is on a border for resizing
-            pos = event.position().toPoint() # Position relative to the widget
-            w, h = self.width(), self.height() # Current window dimensions
-
-            on_left = pos.x() <= RESIZE_GRIP_SIZE
-            on_right = pos.x() >= w - RESIZE_GRIP_SIZE
-            on_top = pos.y() <= RESIZE_GRIP_SIZE
-            on_bottom = pos.y() >= h - RESIZE_GRIP_SIZE
-
-            if on_top and on_left:
-                self.resizing_from = 'top_left'
-            elif on_top and on_right:
-                self.resizing_from = 'top_right'
-            elif on_bottom and on_left:
-                self.resizing_from = 'bottom_left'
-            elif on_bottom and on_right:
-                self.resizing_from = 'bottom_right'
-            elif on_left:
-                self.resizing_from = 'left'
-            elif on_right:
-                self.resizing_from = 'right'
-            elif on_top:
-                self.resizing_from = 'top'
-            elif on_bottom:
-                self.resizing_from = 'bottom'
-
+            self.resizing_from = self._edge_mask(event.position().toPoint())
             if self.resizing_from:
                 self.resizing = True
+                self._set_text_wrap_frozen(True)
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent):
         if self.resizing and event.buttons() == Qt.MouseButton.LeftButton:
             delta = event.globalPosition().toPoint() - self.start_pos
             rect = self.start_geometry
+            width_sign, height_sign = _EDGE_RESIZE_SIGNS[self.resizing_from]
 
-            new_x, new_y, new_w, new_h = rect.x(), rect.y(), rect.width(), rect.height()
-
-            if 'right' in self.resizing_from:
-                new_w = max(self.minimumWidth(), rect.width() + delta.x())
-            if 'bottom' in self.resizing_from:
-                new_h = max(self.minimumHeight(), rect.height() + delta.y())
-            if 'left' in self.resizing_from:
-                new_x = rect.x() + delta.x()
-                new_w = max(self.minimumWidth(), rect.width() - delta.x())
-                # Adjust new_x if new_w hits minimum
-                if new_w <= self.minimumWidth() and rect.width() > self.minimumWidth():
-                    new_x = self.start_geometry.x() + (self.start_geometry.width() - self.minimumWidth())
-            if 'top' in self.resizing_from:
-                new_y = rect.y() + delta.y()
-                new_h = max(self.minimumHeight(), rect.height() - delta.y())
-                # Adjust new_y if new_h hits minimum
-                if new_h <= self.minimumHeight() and rect.height() > self.minimumHeight():
-                    new_y = self.start_geometry.y() + (self.start_geometry.height() - self.minimumHeight())
-
-            self.setGeometry(new_x, new_y, new_w, new_h)
+            new_w = max(self.minimumWidth(), rect.width() + width_sign * delta.x())
+            new_h = max(self.minimumHeight(), rect.height() + height_sign * delta.y())
+            # Dragging the left/top edge keeps the right/bottom edge in place, also once the minimum size is hit
+            new_x = rect.x() + rect.width() - new_w if width_sign < 0 else rect.x()
+            new_y = rect.y() + rect.height() - new_h if height_sign < 0 else rect.y()
+
+            self.set_geometry_throttled(QRect(new_x, new_y, new_w, new_h))
 
         elif not self.resizing: # Change cursor shape when hovering
-            pos = event.position().toPoint()
-            w, h = self.width(), self.height()
-
-            on_left = pos.x() <= RESIZE_GRIP_SIZE
-            on_right = pos.x() >= w - RESIZE_GRIP_SIZE
-            on_top = pos.y() <= RESIZE_GRIP_SIZE
-            on_bottom = pos.y() >= h - RESIZE_GRIP_SIZE
-
-            if (on_top and on_left) or (on_bottom and on_right):
-                self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-            elif (on_top and on_right) or (on_bottom and on_left):
-                self.setCursor(Qt.CursorShape.SizeBDiagCursor)
-            elif on_left or on_right:
-                self.setCursor(Qt.CursorShape.SizeHorCursor)
-            elif on_top or on_bottom:
-                self.setCursor(Qt.CursorShape.SizeVerCursor)
-            else:
-                self.unsetCursor() # Reset to default cursor
+            self._set_resize_cursor(_EDGE_CURSORS.get(self._edge_mask(event.position().toPoint())))
 
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
+        self.flush_pending_geometry()
+        if self.resizing:
+            self._set_text_wrap_frozen(False)
         self.resizing = False
-        self.resizing_from = None
+        self.resizing_from = 0
         self.start_pos = None
         self.start_geometry = None
-        self.unsetCursor() # Ensure cursor is reset
+        self._set_resize_cursor(None) # Ensure cursor is reset
         super().mouseReleaseEvent(event)
 
+    def _edge_mask(self, pos):
+        """
+        Returns the EDGE_* bits of the borders within RESIZE_GRIP_SIZE of pos (relative to the window).
+        On a window too narrow/short for both grips, the left/top edge wins.
+        """
+        on_left = pos.x() <= RESIZE_GRIP_SIZE
+        on_right = not on_left and pos.x() >= self.width() - RESIZE_GRIP_SIZE
+        on_top = pos.y() <= RESIZE_GRIP_SIZE
+        on_bottom = not on_top and pos.y() >= self.height() - RESIZE_GRIP_SIZE
+        return (on_top << 3) | (on_bottom << 2) | (on_left << 1) | on_right
+
+    def _set_text_wrap_frozen(self, frozen):
+        """
+        While the window is being resized, wrap rich text at the width it had when the resize
+        started, so the document is laid out again once on release instead of on every step.
+        QPlainTextEdit only lays out the blocks it shows, so it is left alone.
+        """
+        if not isinstance(self.text_edit, QTextEdit):
+            return
+        if frozen:
+            self.text_edit.setLineWrapColumnOrWidth(self.text_edit.viewport().width())
+            self.text_edit.setLineWrapMode(QTextEdit.LineWrapMode.FixedPixelWidth)
+        else:
+            self.text_edit.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+
+    def set_geometry_throttled(self, rect):
+        """
+        Applies a new window geometry while dragging, at most once per DRAG_UPDATE_INTERVAL_MS.
+        Geometry requested in between is kept and applied by flush_pending_geometry.
+        """
+        if self._resize_clock.elapsed() >= DRAG_UPDATE_INTERVAL_MS:
+            self._pending_geometry = None
+            self._pending_geometry_timer.stop()
+            self.setGeometry(rect)
+            self._resize_clock.restart()
+        else:
+            self._pending_geometry = rect
+            if not self._pending_geometry_timer.isActive():
+                self._pending_geometry_timer.start() # Catch up if the mouse stops moving
+
+    def flush_pending_geometry(self):
+        """Applies the last geometry skipped by set_geometry_throttled, if any."""
+        self._pending_geometry_timer.stop()
+        if self._pending_geometry is not None:
+            self.setGeometry(self._pending_geometry)
+            self._pending_geometry = None
+            self._resize_clock.restart()
+
     def leaveEvent(self, event):
         # Reset cursor when mouse leaves the window, in case it was a resize cursor
         if not self.resizing: # Only unset if not currently dragging
-            self.unsetCursor()
+            self._set_resize_cursor(None)
         super().leaveEvent(event)
 
+    def _set_resize_cursor(self, cursor_shape):
+        """Sets the window cursor (None resets it to the default), only when it actually changes."""
+        if cursor_shape == self._current_cursor_shape:
+            return
+        if cursor_shape is None:
+            self.unsetCursor()
+        else:
+            self.setCursor(cursor_shape)
+        self._current_cursor_shape = cursor_shape
+
     def _on_text_changed(self):
         """
         Called when the text in the QTextEdit changes due to user input.
-        Updates the note data and emits a signal.
+        (Re)starts the debounce timer; the real work is done in _flush_text_changes.
         """
-        # Get the current HTML content from the text_edit
-        current_html = self.text_edit.toHtml()
-        self.note_data["content"] = current_html
+        self._dirty_timer.start()
 
-        # Extract the first few lines for the title preview
-        doc = QTextDocument()
-        doc.setHtml(current_html)
-        title_text = doc.toPlainText().split('\n')
-        new_title = "\n".join(title_text[:PREVIEW_LINES]).strip()
+    def _flush_text_changes(self):
+        """
+        Updates the note title and emits a signal.
+        Serializing the content is left to sync_content, which runs when the notes are saved.
+        """
+        self._dirty_timer.stop()
+        self._content_dirty = True
+
+        # Extract the first few lines for the title preview, reading only as many
+        # blocks of the document as needed
+        title_lines = []
+        block = self.text_edit.document().firstBlock()
+        while block.isValid() and len(title_lines) < PREVIEW_LINES:
+            # Same conversions as toPlainText(): soft line breaks and non-breaking spaces
+            title_lines.extend(block.text().replace('\u00a0', ' ').split('\u2028'))
+            block = block.next()
+        new_title = "\n".join(title_lines[:PREVIEW_LINES]).strip()
         if not new_title:
             new_title = f"New Note {self.note_id[:8]}" # Fallback if text is empty
 
-        self.note_data["title"] = new_title
-        self.title_bar.set_note_title(new_title) # Update title in custom title bar
+        if new_title != self.note_data.get("title"): # Most edits don't touch the first lines
+            self.note_data["title"] = new_title
+            self.title_bar.set_note_title(new_title) # Update title in custom title bar
 
         # Emit signal to notify parent (SideToolbarApp) about the update
         self.note_updated.emit(self.note_id, self.note_data)
 
+    def sync_content(self):
+        """
+        Stores the editor content in note_data if it was edited since the last call.
+        Serializing walks the whole document, so it runs once per save rather than on every edit.
+        """
+        if self._content_dirty:
+            if self.note_data.get("rich", True):
+                self.note_data["content"] = self.text_edit.toHtml()
+            else:
+                self.note_data["content"] = self.text_edit.toPlainText()
+            self._content_dirty = False
+
+    def _create_text_edit(self, rich, content):
+        """
+        Creates the editor for this note: a QTextEdit for rich text notes,
+        the much lighter QPlainTextEdit for plain text notes.
+        """
+        if rich:
+            text_edit = QTextEdit()
+            text_edit.setAcceptRichText(True) # Allow HTML, images, tables
+            text_edit.setHtml(content)
+        else:
+            text_edit = QPlainTextEdit()
+            text_edit.setPlainText(content)
+        text_edit.textChanged.connect(self._on_text_changed)
+        return text_edit
+
+    def _enable_rich_text(self):
+        """Switches a plain text note to a rich text editor, keeping its text."""
+        rich_text_edit = self._create_text_edit(True, "")
+        with QSignalBlocker(rich_text_edit): # Not an edit, _flush_text_changes() runs below anyway
+            rich_text_edit.setPlainText(self.text_edit.toPlainText())
+        cursor = rich_text_edit.textCursor()
+        cursor.setPosition(self.text_edit.textCursor().position()) # Keep the caret where it was
+        rich_text_edit.setTextCursor(cursor)
+        self.content_layout.replaceWidget(self.text_edit, rich_text_edit)
+        self.text_edit.deleteLater()
+        self.text_edit = rich_text_edit
+        self.text_edit.setFocus()
+
+        self.note_data["rich"] = True
+        self.rich_text_button.hide()
+        self._flush_text_changes() # Store the content as HTML right away
+
     # Removed _filter_note_content method
 
     def _confirm_delete(self):
@@ -327,74 +613,228 @@ class StickyNoteWindow(QMainWindow):
         self.note_deleted.emit(self.note_id)
         self.close() # Close the window after signaling deletion
 
-    def closeEvent(self, event):
+    def sync_note_data(self):
         """
-        Overrides the close event to save the window's position and size.
+        Stores pending edits and the window's position and size in note_data.
+        Only emits note_updated for edits still waiting on the text change timer.
         """
+        if self._dirty_timer.isActive():
+            self._flush_text_changes() # Don't lose the last burst of edits
+        self.sync_content()
         self.note_data["x"] = self.x()
         self.note_data["y"] = self.y()
         self.note_data["width"] = self.width()
         self.note_data["height"] = self.height()
+
+    def closeEvent(self, event):
+        """
+        Overrides the close event to save the window's position and size.
+        """
+        self.sync_note_data()
         self.note_updated.emit(self.note_id, self.note_data) # Ensure state is saved on close
+        self.note_closed.emit(self.note_id)
         event.accept() # Accept the close event, hiding the window
 
 
-class NotePreviewWidget(QFrame):
+class NotesModel(QAbstractListModel):
     """
-    A clickable widget for displaying a preview of a note in the toolbar.
+    List model of the notes shown in the toolbar, as (note_id, title) rows sorted by title.
     """
-    open_note_signal = pyqtSignal(str) # Signal: note_id
-    delete_note_signal = pyqtSignal(str) # Signal: note_id
+    NoteIdRole = Qt.ItemDataRole.UserRole
 
-    def __init__(self, note_id, note_title, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.note_id = note_id
-        self.note_title = note_title
-
-        self.setFrameShape(QFrame.Shape.Box)
-        self.setLineWidth(1)
-        self.setStyleSheet("border: 1px solid #ccc; border-radius: 5px; padding: 5px; background-color: #f9f9f9;")
+        self._rows = [] # [(note_id, title)]
+        self._sort_keys = [] # Lowercased titles, parallel to _rows, so they're only lowered once
+        self._titles = {} # {note_id: title}, to skip unchanged titles and find rows by bisection
+
+    @staticmethod
+    def _title_of(note_id, note_data):
+        return note_data.get("title", f"New Note {note_id[:8]}").strip()
+
+    def _find_row(self, note_id):
+        title = self._titles.get(note_id)
+        if title is None:
+            return -1
+        row = bisect.bisect_left(self._sort_keys, title.lower())
+        while self._rows[row][0] != note_id: # Step over other notes with the same title
+            row += 1
+        return row
+
+    def set_notes(self, notes):
+        """Replaces all rows with the notes in a {note_id: note_data} dict."""
+        self.beginResetModel()
+        keyed_rows = []
+        for note_id, note_data in notes.items():
+            title = self._title_of(note_id, note_data)
+            keyed_rows.append((title.lower(), note_id, title))
+        keyed_rows.sort()
+        self._sort_keys = [sort_key for sort_key, _, _ in keyed_rows]
+        self._rows = [(note_id, title) for _, note_id, title in keyed_rows]
+        self._titles = {note_id: title for _, note_id, title in keyed_rows}
+        self.endResetModel()
+
+    def add_note(self, note_id, note_data):
+        """Inserts a single note at its sorted position."""
+        title = self._title_of(note_id, note_data)
+        sort_key = title.lower()
+        row = bisect.bisect_right(self._sort_keys, sort_key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sort_keys.insert(row, sort_key)
+        self._rows.insert(row, (note_id, title))
+        self._titles[note_id] = title
+        self.endInsertRows()
+
+    def remove_note(self, note_id):
+        """Removes a single note, if it is in the model."""
+        row = self._find_row(note_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._sort_keys[row]
+        del self._rows[row]
+        del self._titles[note_id]
+        self.endRemoveRows()
+
+    def update_note(self, note_id, note_data):
+        """Refreshes the title of a single note, moving its row if the sort order changed."""
+        title = self._title_of(note_id, note_data)
+        if title == self._titles.get(note_id):
+            return # Title unchanged, nothing to re-sort or repaint
+        old_row = self._find_row(note_id)
+        if old_row < 0:
+            self.add_note(note_id, note_data)
+            return
+        sort_key = title.lower()
+        self._titles[note_id] = title
+        # Row the note ends up at once it's out of its old row. The rows can't change before
+        # beginMoveRows(), views and proxies read the model as it was while it runs.
+        new_row = bisect.bisect_right(self._sort_keys, sort_key)
+        if self._sort_keys[old_row] <= sort_key:
+            new_row -= 1 # The old row was counted before the new position
+        if new_row != old_row:
+            # Qt wants the destination as a row of the list before the move
+            self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), new_row + 1 if new_row > old_row else new_row)
+            del self._sort_keys[old_row]
+            del self._rows[old_row]
+            self._sort_keys.insert(new_row, sort_key)
+            self._rows.insert(new_row, (note_id, title))
+            self.endMoveRows()
+        else:
+            self._sort_keys[old_row] = sort_key
+            self._rows[old_row] = (note_id, title)
+        index = self.index(new_row)
+        self.dataChanged.emit(index, index)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        note_id, title = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return title
+        if role == self.NoteIdRole:
+            return note_id
+        return None
+
+
+class NotePreviewDelegate(QStyledItemDelegate):
+    """
+    Paints the preview of a note in the toolbar (its title and a delete button).
+    The list view only asks for the rows inside its viewport, so no widgets are created per note.
+    """
+    open_note_signal = pyqtSignal(str) # Signal: note_id
+    delete_note_signal = pyqtSignal(str) # Signal: note_id
 
-        self.layout = QVBoxLayout()
-        self.setLayout(self.layout)
-        self.layout.setContentsMargins(5, 5, 5, 5) # Smaller margins inside preview
+    PADDING = 10 # Space between the preview border and its contents
+    SPACING = 5  # Space between the title and the delete button
+    BUTTON_SIZE = QSize(60, 25)
+
+    # Colors are built once here rather than parsed from their names on every paint
+    FRAME_BORDER_COLOR = QColor("#cccccc")
+    FRAME_BACKGROUND_COLOR = QColor("#f9f9f9")
+    BUTTON_BORDER_COLOR = QColor("#ff9999")
+    BUTTON_BACKGROUND_COLOR = QColor("#ffcccc")
+    TEXT_COLOR = QColor("black")
+
+    def _button_rect(self, rect):
+        return QRect(
+            rect.right() - self.PADDING - self.BUTTON_SIZE.width(),
+            rect.bottom() - self.PADDING - self.BUTTON_SIZE.height(),
+            self.BUTTON_SIZE.width(),
+            self.BUTTON_SIZE.height()
+        )
 
-        # Title/preview label
-        self.title_label = QLabel(self.note_title)
-        self.title_label.setWordWrap(True) # Ensure long titles wrap
-        self.layout.addWidget(self.title_label)
+    def _title_rect(self, rect):
+        return rect.adjusted(
+            self.PADDING, self.PADDING,
+            -self.PADDING, -(self.PADDING + self.SPACING + self.BUTTON_SIZE.height())
+        )
 
-        # Delete button
-        self.delete_button = QPushButton("Delete")
-        self.delete_button.setFixedSize(QSize(60, 25)) # Smaller delete button
-        self.delete_button.clicked.connect(self._confirm_delete)
-        self.delete_button.setStyleSheet("background-color: #ffcccc; border: 1px solid #ff9999; border-radius: 3px;") # Reddish delete button
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(option.font)
+
+        # Preview frame
+        painter.setPen(self.FRAME_BORDER_COLOR)
+        painter.setBrush(self.FRAME_BACKGROUND_COLOR)
+        painter.drawRoundedRect(QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5), 5, 5)
+
+        # Title/preview text
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(
+            self._title_rect(option.rect),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            index.data()
+        )
 
-        # Add delete button to a horizontal layout to push it to the right
-        button_h_layout = QHBoxLayout()
-        button_h_layout.addStretch()
-        button_h_layout.addWidget(self.delete_button)
-        self.layout.addLayout(button_h_layout)
+        # Reddish delete button
+        button_rect = self._button_rect(option.rect)
+        painter.setPen(self.BUTTON_BORDER_COLOR)
+        painter.setBrush(self.BUTTON_BACKGROUND_COLOR)
+        painter.drawRoundedRect(QRectF(button_rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, "Delete")
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        view = option.widget
+        width = view.viewport().width() - 2 * view.spacing()
+        text_rect = option.fontMetrics.boundingRect(
+            QRect(0, 0, width - 2 * self.PADDING, 0),
+            Qt.TextFlag.TextWordWrap,
+            index.data()
+        )
+        return QSize(width, self.PADDING + text_rect.height() + self.SPACING + self.BUTTON_SIZE.height() + self.PADDING)
 
-    def mousePressEvent(self, event: QMouseEvent):
+    def editorEvent(self, event, model, option, index):
         """
-        Emits a signal when the preview widget is clicked (to open the note).
+        Opens the note when its preview is clicked, or asks to delete it when the button is clicked.
         """
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.open_note_signal.emit(self.note_id)
-        super().mousePressEvent(event) # Call base class event handler
+        if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+            note_id = index.data(NotesModel.NoteIdRole)
+            if self._button_rect(option.rect).contains(event.position().toPoint()):
+                self._confirm_delete(option.widget, note_id)
+            else:
+                self.open_note_signal.emit(note_id)
+            return True
+        return super().editorEvent(event, model, option, index)
 
-    def _confirm_delete(self):
+    def _confirm_delete(self, parent, note_id):
         """Asks for confirmation before deleting the note."""
         reply = QMessageBox.question(
-            self,
+            parent,
             "Delete Note",
             "Are you sure you want to delete this note from the toolbar?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.delete_note_signal.emit(self.note_id)
+            self.delete_note_signal.emit(note_id)
 
 
 class SideToolbarApp(QMainWindow):
@@ -402,6 +842,8 @@ class SideToolbarApp(QMainWindow):
     The main toolbar application that sits on the side of the screen.
     Manages loading, saving, and displaying note previews.
     """
+    save_failed = pyqtSignal(list, list, bool) # Signal: note ids to save again, note ids to remove again, legacy file still there
+
     def __init__(self):
         super().__init__()
         # Removed the fixed window title here, as we're adding a custom title bar
@@ -409,6 +851,21 @@ class SideToolbarApp(QMainWindow):
         self.notes = {}  # Stores all note data: {note_id: note_data}
         self.open_sticky_notes = {} # Stores references to open StickyNoteWindow instances: {note_id: StickyNoteWindow}
 
+        # Note updates only mark the notes dirty; the timer coalesces them into one write
+        self._dirty_note_ids = set() # Notes updated since the last save; only these are serialized
+        self._deleted_note_ids = set() # Notes deleted since the last save, whose files are removed
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_notes)
+        self._save_pool = QThreadPool(self) # A single save thread, so saves run one at a time and in order
+        self._save_pool.setMaxThreadCount(1)
+        self._last_saved_digests = {} # {file path: digest of the bytes last written/read}, to skip no-op writes
+        self._last_saved_digests_lock = QMutex() # The save thread updates _last_saved_digests
+        self._legacy_notes_loaded = False # True until notes loaded from NOTES_FILE are migrated
+        self.save_failed.connect(self._handle_save_failure) # Queued, it is emitted on the save thread
+        QApplication.instance().aboutToQuit.connect(self._flush_pending_save)
+
         self._setup_ui()
         self._load_notes()
         self._display_notes()
@@ -450,7 +907,7 @@ class SideToolbarApp(QMainWindow):
         # Custom Title Bar for the Toolbar itself
         self.toolbar_title_bar = QFrame() # Using QFrame for the title bar to apply styles
         self.toolbar_title_bar.setFixedHeight(35)
-        self.toolbar_title_bar.setStyleSheet("background-color: #A0A0A0; border-top-left-radius: 5px; border-top-right-radius: 5px;")
+        self.toolbar_title_bar.setObjectName("ToolbarTitleBar")
         self.toolbar_title_bar.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
         self.toolbar_title_bar_layout = QHBoxLayout(self.toolbar_title_bar)
@@ -458,27 +915,21 @@ class SideToolbarApp(QMainWindow):
         self.toolbar_title_bar_layout.setSpacing(8)
 
         self.toolbar_title_label = QLabel("Sticky Notes Toolbar")
-        self.toolbar_title_label.setStyleSheet("color: black; font-weight: bold; font-size: 11pt;")
+        self.toolbar_title_label.setObjectName("TitleLabel")
         self.toolbar_title_bar_layout.addWidget(self.toolbar_title_label)
         self.toolbar_title_bar_layout.addStretch()
 
         # Minimize Button for Toolbar
         self.toolbar_minimize_button = QPushButton("—")
         self.toolbar_minimize_button.setFixedSize(30, 30)
-        self.toolbar_minimize_button.setStyleSheet(
-            "QPushButton { background-color: #7777CC; border: 1px solid #5555AA; border-radius: 5px; color: white; font-weight: bold; font-size: 12pt; }"
-            "QPushButton:hover { background-color: #5555AA; }"
-        )
+        self.toolbar_minimize_button.setObjectName("MinimizeButton")
         self.toolbar_minimize_button.clicked.connect(self.showMinimized)
         self.toolbar_title_bar_layout.addWidget(self.toolbar_minimize_button)
 
         # Close Button for Toolbar
         self.toolbar_close_button = QPushButton("X")
         self.toolbar_close_button.setFixedSize(30, 30)
-        self.toolbar_close_button.setStyleSheet(
-            "QPushButton { background-color: #CC3333; border: 1px solid #990000; border-radius: 5px; color: white; font-weight: bold; font-size: 12pt; }"
-            "QPushButton:hover { background-color: #990000; }"
-        )
+        self.toolbar_close_button.setObjectName("CloseButton")
         self.toolbar_close_button.clicked.connect(self.close)
         self.toolbar_title_bar_layout.addWidget(self.toolbar_close_button)
 
@@ -490,6 +941,10 @@ class SideToolbarApp(QMainWindow):
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Filter notes...")
         self.filter_input.textChanged.connect(self._filter_notes)
+        self._filter_timer = QTimer(self) # Applies the filter once typing pauses
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
         # Wrap filter_input and add_note_button in a separate layout for consistent margins
         controls_layout = QVBoxLayout()
         controls_layout.setContentsMargins(10, 10, 10, 10) # Apply internal padding
@@ -502,31 +957,35 @@ class SideToolbarApp(QMainWindow):
         self.layout.addLayout(controls_layout)
 
 
-        # Scrollable area for notes list
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.notes_list_widget = QWidget()
-        self.notes_list_layout = QVBoxLayout(self.notes_list_widget)
-        self.notes_list_layout.setAlignment(Qt.AlignmentFlag.AlignTop) # Align items to the top
-        self.notes_list_layout.setSpacing(10) # Spacing between note previews
-        self.notes_list_layout.setContentsMargins(10, 10, 10, 10) # Add margins for the list content
-
-        self.scroll_area.setWidget(self.notes_list_widget)
-        self.layout.addWidget(self.scroll_area)
-
-        # Apply rounded corners and background to the entire central widget for the toolbar
-        central_widget.setStyleSheet(
-            "QWidget { background-color: #E0E0E0; border-radius: 5px; border: 1px solid #AAAAAA; }"
-            "QLineEdit { padding: 5px; border: 1px solid #ccc; border-radius: 3px; }"
-            "QPushButton { padding: 5px; }" # Basic button styling for toolbar buttons
-        )
+        # Notes list: a model/view pair, so only previews in the viewport are ever painted
+        self.notes_model = NotesModel(self)
+        self.notes_proxy_model = QSortFilterProxyModel(self)
+        self.notes_proxy_model.setSourceModel(self.notes_model)
+        self.notes_proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+        self.notes_delegate = NotePreviewDelegate(self)
+        self.notes_delegate.open_note_signal.connect(self._open_sticky_note)
+        self.notes_delegate.delete_note_signal.connect(self._delete_note)
+
+        self.notes_view = QListView()
+        self.notes_view.setModel(self.notes_proxy_model)
+        self.notes_view.setItemDelegate(self.notes_delegate)
+        self.notes_view.setSpacing(5) # Spacing between note previews
+        self.notes_view.setResizeMode(QListView.ResizeMode.Adjust) # Re-wrap titles when the width changes
+        self.notes_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.notes_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.notes_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        # Lay rows out a batch at a time after a reset, so a long list of notes doesn't hold up
+        # the first paint (each row's height depends on its word-wrapped title)
+        self.notes_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.notes_view.setBatchSize(50)
+        self.layout.addWidget(self.notes_view)
+
+        # Rounded corners and background for the entire central widget, plus a light grey
+        # window background behind its corners (see APP_STYLE_SHEET)
+        central_widget.setObjectName("ToolbarCentral")
         central_widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-
-        # Apply a distinct background color for the main toolbar window (topmost background)
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor("#E0E0E0")) # Light grey
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
+        self.setObjectName("Toolbar")
 
 
         # Make toolbar draggable by its custom title bar
@@ -561,58 +1020,131 @@ class SideToolbarApp(QMainWindow):
         self.move(x, y)
 
     def _load_notes(self):
-        """Loads notes from the JSON file."""
+        """
+        Loads the metadata of all notes from NOTES_DIR.
+        Note content is only read from disk when a note is opened (see _load_note_content).
+        Also loads the legacy NOTES_FILE while it exists, which is migrated to NOTES_DIR on the
+        next save. It is only removed once that succeeded, so it can outlive an interrupted migration.
+        """
+        self.notes = {}
+        if os.path.isdir(NOTES_DIR):
+            for meta_path in glob.glob(os.path.join(NOTES_DIR, "*.json")):
+                try:
+                    with open(meta_path, 'rb') as f:
+                        payload = f.read()
+                    note = _intern_short_strings(_loads(payload))
+                    self.notes[note["id"]] = note
+                except json.JSONDecodeError:
+                    print(f"Warning: Could not decode {meta_path}. Skipping this note.")
+                    continue
+                except Exception as e:
+                    print(f"Error loading note {meta_path}: {e}")
+                    continue
+                self._last_saved_digests[_note_meta_path(note["id"])] = _payload_digest(payload)
         if os.path.exists(NOTES_FILE):
             try:
-                with open(NOTES_FILE, 'r', encoding='utf-8') as f:
-                    loaded_notes_list = json.load(f)
-                    self.notes = {note["id"]: note for note in loaded_notes_list}
+                with open(NOTES_FILE, 'rb') as f:
+                    raw = f.read()
+                legacy_notes = {note["id"]: _intern_short_strings(note) for note in _loads(raw)}
             except json.JSONDecodeError:
-                print(f"Warning: Could not decode {NOTES_FILE}. Starting with empty notes.")
-                self.notes = {}
+                print(f"Warning: Could not decode {NOTES_FILE}. Skipping legacy notes.")
             except Exception as e:
                 print(f"Error loading notes: {e}")
-                self.notes = {}
-        else:
-            self.notes = {}
+            else:
+                for note_id, legacy_note in legacy_notes.items():
+                    note = self.notes.get(note_id)
+                    if note is None:
+                        self.notes[note_id] = legacy_note
+                    elif "content" in legacy_note and not os.path.exists(_note_content_path(note_id, note.get("rich", True))):
+                        # Already migrated, but its content file wasn't written yet. Notes in
+                        # NOTES_DIR are otherwise newer, they were saved after the migration began.
+                        note["content"] = legacy_note["content"]
+                self._legacy_notes_loaded = True
+                self._dirty_note_ids.update(legacy_notes)
+                self._save_timer.start() # Migrate to NOTES_DIR
+
+    def _load_note_content(self, note_id, rich):
+        """
+        Reads the content of a note from disk.
+        Falls back to the content file of the other kind (plain/rich text) if the expected one is missing.
+        Returns None if the content file exists but can't be read.
+        """
+        for file_rich in (rich, not rich):
+            content_path = _note_content_path(note_id, file_rich)
+            try:
+                with open(content_path, 'rb') as f:
+                    payload = f.read()
+                content = payload.decode('utf-8')
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Error loading note content {content_path}: {e}")
+                return None
+            digest = _payload_digest(payload)
+            with QMutexLocker(self._last_saved_digests_lock):
+                self._last_saved_digests[content_path] = digest
+            if file_rich != rich:
+                # E.g. the note was switched to rich text, but its .html file never made it to
+                # disk. The .txt file is removed once the converted content has been saved.
+                document = QTextDocument()
+                if rich:
+                    document.setPlainText(content)
+                    content = document.toHtml()
+                else:
+                    document.setHtml(content)
+                    content = document.toPlainText()
+            return content
+        return "" # Nothing was ever typed into this note
 
     def _save_notes(self):
-        """Saves current notes to the JSON file."""
-        try:
-            with open(NOTES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(list(self.notes.values()), f, indent=4)
-        except Exception as e:
-            print(f"Error saving notes: {e}")
-
-    def _display_notes(self):
-        """Clears and re-populates the notes list in the toolbar."""
-        # Clear existing widgets
-        for i in reversed(range(self.notes_list_layout.count())):
-            widget_to_remove = self.notes_list_layout.itemAt(i).widget()
-            if widget_to_remove:
-                widget_to_remove.setParent(None)
-
-        filter_text = self.filter_input.text().lower()
-
-        # Add notes, filtered if necessary
-        # Sort notes by title for consistent display
-        sorted_note_ids = sorted(self.notes.keys(), key=lambda note_id: self.notes[note_id].get("title", "").lower())
-
-        for note_id in sorted_note_ids:
+        """
+        Saves the notes updated or deleted since the last save to NOTES_DIR, where each note
+        has one metadata file and one content file.
+        Only a snapshot of the notes is taken here, a _SaveRunnable serializes and writes it
+        on the save thread. Files are replaced atomically and left untouched if nothing changed.
+        """
+        self._save_timer.stop()
+        # Metadata values are immutable, so fresh dicts are enough to keep the snapshot stable
+        snapshot = []
+        for note_id in self._dirty_note_ids:
+            if note_id in self.open_sticky_notes:
+                self.open_sticky_notes[note_id].sync_content() # Serialize text edited since the last save
             note_data = self.notes[note_id]
-            note_title = note_data.get("title", f"New Note {note_id[:8]}").strip()
-
-            if filter_text and filter_text not in note_title.lower():
-                continue # Skip if not matching filter
+            snapshot.append((note_id, {key: value for key, value in note_data.items() if key != "content"}, note_data.get("content")))
+        self._save_pool.start(_SaveRunnable(
+            snapshot, self._deleted_note_ids, self._legacy_notes_loaded,
+            self._last_saved_digests, self._last_saved_digests_lock, self.save_failed
+        ))
+        self._dirty_note_ids = set()
+        self._deleted_note_ids = set()
+        self._legacy_notes_loaded = False
+
+    def _handle_save_failure(self, failed_note_ids, failed_deleted_note_ids, legacy_file_pending):
+        """Queues whatever a _SaveRunnable couldn't write or remove, so the next save retries it."""
+        self._dirty_note_ids.update(note_id for note_id in failed_note_ids if note_id in self.notes)
+        self._deleted_note_ids.update(note_id for note_id in failed_deleted_note_ids if note_id not in self.notes)
+        self._legacy_notes_loaded = self._legacy_notes_loaded or legacy_file_pending
+
+    def _flush_pending_save(self):
+        """Writes notes to disk right away if there are unsaved updates, and waits until all writes are done."""
+        if self._dirty_note_ids or self._deleted_note_ids or self._legacy_notes_loaded:
+            self._save_notes()
+        self._save_pool.waitForDone()
 
-            preview_widget = NotePreviewWidget(note_id, note_title)
-            preview_widget.open_note_signal.connect(self._open_sticky_note)
-            preview_widget.delete_note_signal.connect(self._delete_note_from_toolbar)
-            self.notes_list_layout.addWidget(preview_widget)
+    def _display_notes(self):
+        """
+        Re-populates the whole notes list in the toolbar.
+        Single notes are added, updated and removed through the model's per-row methods.
+        """
+        self.notes_model.set_notes(self.notes)
 
     def _filter_notes(self, text):
-        """Re-displays notes based on the filter text."""
-        self._display_notes()
+        """Schedules the filter to be applied once the user stops typing."""
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        """Shows only the notes whose title contains the filter text."""
+        self.notes_proxy_model.setFilterFixedString(self.filter_input.text())
 
     def _add_new_note(self):
         """Creates a new empty note and opens it."""
@@ -621,68 +1153,82 @@ class SideToolbarApp(QMainWindow):
             "id": new_note_id,
             "title": "New Note",
             "content": "",
+            "rich": False, # New notes start as plain text, see StickyNoteWindow._enable_rich_text
             "x": 100, "y": 100, "width": 400, "height": 300 # Default size and position
         }
         self.notes[new_note_id] = new_note_data
+        self._dirty_note_ids.add(new_note_id)
         self._save_notes()
-        self._display_notes() # Update toolbar with new note
+        self.notes_model.add_note(new_note_id, new_note_data) # Update toolbar with new note
         self._open_sticky_note(new_note_id) # Open the new note immediately
 
     def _open_sticky_note(self, note_id):
         """Opens an existing sticky note window or brings it to front."""
-        if note_id in self.open_sticky_notes and self.open_sticky_notes[note_id].isVisible():
-            # If already open and visible, just bring it to front
+        if note_id in self.open_sticky_notes:
+            # If already open, just bring it to front
             self.open_sticky_notes[note_id].activateWindow()
             self.open_sticky_notes[note_id].raise_()
         else:
             note_data = self.notes.get(note_id)
+            if note_data and "content" not in note_data:
+                # Content is loaded lazily on first open
+                content = self._load_note_content(note_id, note_data.get("rich", True))
+                if content is None:
+                    QMessageBox.warning(self, "Error", "Could not load the note content!")
+                    return
+                note_data["content"] = content
             if note_data:
                 sticky_note_window = StickyNoteWindow(note_id, note_data)
                 sticky_note_window.note_updated.connect(self._handle_note_update)
-                sticky_note_window.note_deleted.connect(self._handle_note_deletion)
+                sticky_note_window.note_deleted.connect(self._delete_note)
+                sticky_note_window.note_closed.connect(self._handle_note_closed)
                 self.open_sticky_notes[note_id] = sticky_note_window
                 sticky_note_window.show()
             else:
                 QMessageBox.warning(self, "Error", "Note not found!")
 
     def _handle_note_update(self, note_id, note_data):
-        """Receives updates from a StickyNoteWindow and saves them."""
+        """Receives updates from a StickyNoteWindow and schedules a save."""
+        if note_id not in self.notes:
+            return # Note was deleted; ignore the final update from its closing window
         self.notes[note_id] = note_data
-        self._save_notes()
-        self._display_notes() # Refresh toolbar in case title changed
+        self._dirty_note_ids.add(note_id)
+        self._save_timer.start()
+        self.notes_model.update_note(note_id, note_data) # Refresh toolbar in case title changed
 
-    def _handle_note_deletion(self, note_id):
-        """Handles deletion initiated from a StickyNoteWindow."""
-        if note_id in self.notes:
-            del self.notes[note_id]
-            self._save_notes()
-            self._display_notes() # Refresh toolbar
-            if note_id in self.open_sticky_notes:
-                self.open_sticky_notes[note_id].close() # Ensure window is closed
-                del self.open_sticky_notes[note_id]
+    def _handle_note_closed(self, note_id):
+        """Forgets a StickyNoteWindow once it is closed, the window deletes itself."""
+        self.open_sticky_notes.pop(note_id, None)
 
-    def _delete_note_from_toolbar(self, note_id):
-        """Handles deletion initiated from a NotePreviewWidget."""
+    def _delete_note(self, note_id):
+        """
+        Deletes a note, whether from its StickyNoteWindow or from its preview in the toolbar.
+        """
         if note_id in self.notes:
             del self.notes[note_id]
+            self._dirty_note_ids.discard(note_id)
+            self._deleted_note_ids.add(note_id)
             self._save_notes()
-            self._display_notes() # Refresh toolbar
-            if note_id in self.open_sticky_notes:
-                # If the sticky note is open, close it
-                self.open_sticky_notes[note_id].close()
-                del self.open_sticky_notes[note_id]
+            self.notes_model.remove_note(note_id) # Refresh toolbar
+            sticky_note_window = self.open_sticky_notes.pop(note_id, None)
+            if sticky_note_window is not None:
+                sticky_note_window.close() # Ensure window is closed
 
     def closeEvent(self, event):
         """
         Overrides the close event for the main toolbar.
         Ensures all open sticky notes are closed and data is saved.
         """
-        # Ensure all open sticky notes save their state before closing the app
-        for note_id, sticky_note_window in list(self.open_sticky_notes.items()):
-            if sticky_note_window.isVisible():
-                sticky_note_window.close() # This will trigger note_updated signal and save state
-
-        self._save_notes() # Final save just in case
+        # Ensure all open sticky notes save their state before closing the app. Closing a
+        # window stores its state in note_data; with its signals blocked the save below
+        # covers all of them at once instead of a note_updated signal per window.
+        while self.open_sticky_notes:
+            note_id, sticky_note_window = self.open_sticky_notes.popitem()
+            sticky_note_window.blockSignals(True)
+            sticky_note_window.close()
+            self._dirty_note_ids.add(note_id)
+
+        self._flush_pending_save() # Write any updates still waiting on the save timer or thread
         event.accept()
 
 
@@ -692,6 +1238,7 @@ def main():
     # Optional: Set a default font for the application for better consistency
     font = QFont("Inter", 10)
     app.setFont(font)
+    app.setStyleSheet(APP_STYLE_SHEET)
 
     toolbar = SideToolbarApp()
     toolbar.show()